@@ -1,18 +1,66 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, abort
+from flask.json.provider import JSONProvider
+import orjson
 import psutil
 import os
+import threading
 from datetime import datetime
+from waitress import serve
 from deadlock_detector import DeadlockDetector
-from process_monitor import ProcessMonitor
+from process_monitor import ProcessMonitor, PROCESS_COLUMNS
 from recovery_module import RecoveryModule
 
+# orjson options: pids can be dict keys, and Banker matrices may carry NumPy scalars
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that uses orjson for faster (de)serialization"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # orjson already returns bytes, so skip the str -> bytes round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype='application/json')
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Initialize modules
 deadlock_detector = DeadlockDetector()
 process_monitor = ProcessMonitor()
 recovery_module = RecoveryModule()
 
+# Requests are served concurrently, so guard the shared module state.
+# The mutators are short; detector and monitor get separate locks so a
+# slow real-time scan never stalls the manual simulation.
+_detector_lock = threading.RLock()
+_monitor_lock = threading.RLock()
+
+# Latest system-wide CPU sample, refreshed by a background thread so that
+# /api/system/stats never blocks a request for the sampling interval
+_cpu_percent = psutil.cpu_percent(interval=None)
+
+def _sample_cpu_percent():
+    """Continuously refresh the cached CPU percentage"""
+    global _cpu_percent
+    while True:
+        _cpu_percent = psutil.cpu_percent(interval=1)
+
+threading.Thread(target=_sample_cpu_percent, name='cpu-sampler', daemon=True).start()
+
+def _json_body():
+    """Parse a POST body straight from the raw bytes with orjson"""
+    # Bodies are tiny ({process_id, resource_id}), so skip request.json's mimetype checks and caching
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        abort(400, description='Request body must be valid JSON')
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -20,141 +68,168 @@ def index():
 @app.route('/api/manual/add_process', methods=['POST'])
 def add_process():
     """Add a process in manual mode"""
-    data = request.json
+    data = _json_body()
     process_id = data.get('process_id')
     process_name = data.get('process_name')
     
-    deadlock_detector.add_process(process_id, process_name)
+    with _detector_lock:
+        deadlock_detector.add_process(process_id, process_name)
     return jsonify({'status': 'success', 'message': f'Process {process_name} added'})
 
 @app.route('/api/manual/add_resource', methods=['POST'])
 def add_resource():
     """Add a resource in manual mode"""
-    data = request.json
+    data = _json_body()
     resource_id = data.get('resource_id')
     resource_name = data.get('resource_name')
     instances = data.get('instances', 1)
     
-    deadlock_detector.add_resource(resource_id, resource_name, instances)
+    with _detector_lock:
+        deadlock_detector.add_resource(resource_id, resource_name, instances)
     return jsonify({'status': 'success', 'message': f'Resource {resource_name} added'})
 
 @app.route('/api/manual/allocate', methods=['POST'])
 def allocate_resource():
     """Allocate resource to process"""
-    data = request.json
+    data = _json_body()
     process_id = data.get('process_id')
     resource_id = data.get('resource_id')
     
-    deadlock_detector.allocate_resource(process_id, resource_id)
+    with _detector_lock:
+        deadlock_detector.allocate_resource(process_id, resource_id)
     return jsonify({'status': 'success'})
 
 @app.route('/api/manual/request', methods=['POST'])
 def request_resource():
     """Process requests a resource"""
-    data = request.json
+    data = _json_body()
     process_id = data.get('process_id')
     resource_id = data.get('resource_id')
     
-    deadlock_detector.request_resource(process_id, resource_id)
+    with _detector_lock:
+        deadlock_detector.request_resource(process_id, resource_id)
     return jsonify({'status': 'success'})
 
 @app.route('/api/manual/detect', methods=['GET'])
 def detect_deadlock_manual():
     """Detect deadlock in manual mode"""
-    result = deadlock_detector.detect_deadlock()
-    
-    if result['deadlock_detected']:
-        # Get full process details for recovery options
-        process_details = []
-        for process_id in result['deadlock_processes']:
-            if process_id in deadlock_detector.processes:
-                proc = deadlock_detector.processes[process_id]
-                process_details.append({
-                    'id': proc['id'],
-                    'pid': proc['id'],  # Use id as pid for manual mode
-                    'name': proc['name'],
-                    'type': 'user',  # Manual processes are always user type
-                    'cpu_percent': 0,
-                    'memory_percent': 0,
-                    'num_threads': 1
-                })
+    with _detector_lock:
+        result = deadlock_detector.detect_deadlock()
         
-        recovery_options = recovery_module.generate_recovery_options(
-            result['deadlock_cycle'],
-            process_details
-        )
-        result['recovery_options'] = recovery_options
+        if result['deadlock_detected']:
+            # Get full process details for recovery options
+            process_details = []
+            for process_id in result['deadlock_processes']:
+                if process_id in deadlock_detector.processes:
+                    proc = deadlock_detector.processes[process_id]
+                    process_details.append({
+                        'id': proc['id'],
+                        'pid': proc['id'],  # Use id as pid for manual mode
+                        'name': proc['name'],
+                        'type': 'user',  # Manual processes are always user type
+                        'cpu_percent': 0,
+                        'memory_percent': 0,
+                        'num_threads': 1
+                    })
+            
+            recovery_options = recovery_module.generate_recovery_options(
+                result['deadlock_cycle'],
+                process_details
+            )
+            result['recovery_options'] = recovery_options
     
     return jsonify(result)
 
 @app.route('/api/manual/predict', methods=['GET'])
 def predict_deadlock_manual():
     """Predict if system is in safe state"""
-    result = deadlock_detector.predict_deadlock()
+    with _detector_lock:
+        result = deadlock_detector.predict_deadlock()
     return jsonify(result)
 
 @app.route('/api/manual/predict_allocation', methods=['POST'])
 def predict_allocation_manual():
     """Predict if allocation would be safe"""
-    data = request.json
+    data = _json_body()
     process_id = data.get('process_id')
     resource_id = data.get('resource_id')
     
-    result = deadlock_detector.predict_allocation(process_id, resource_id)
+    with _detector_lock:
+        result = deadlock_detector.predict_allocation(process_id, resource_id)
     return jsonify(result)
 
 @app.route('/api/manual/get_state', methods=['GET'])
 def get_manual_state():
     """Get current state of manual simulation"""
-    return jsonify({
-        'processes': deadlock_detector.get_processes(),
-        'resources': deadlock_detector.get_resources(),
-        'graph': deadlock_detector.get_graph_data()
-    })
+    with _detector_lock:
+        return jsonify({
+            'processes': deadlock_detector.get_processes(),
+            'resources': deadlock_detector.get_resources(),
+            'graph': deadlock_detector.get_graph_data()
+        })
 
 @app.route('/api/manual/reset', methods=['POST'])
 def reset_manual():
     """Reset manual simulation"""
-    deadlock_detector.reset()
+    with _detector_lock:
+        deadlock_detector.reset()
     return jsonify({'status': 'success', 'message': 'Simulation reset'})
 
 @app.route('/api/realtime/processes', methods=['GET'])
 def get_realtime_processes():
-    """Get real-time Windows processes"""
-    processes = process_monitor.get_processes()
+    """
+    Get real-time Windows processes
+    ?top=N returns only the top N by CPU; ?columns=pid,name,type limits the fields
+    """
+    top = request.args.get('top', type=int)
+    columns = request.args.get('columns')
+    columns = tuple(columns.split(',')) if columns else None
+    if columns and not set(columns).issubset(PROCESS_COLUMNS):
+        abort(400)
+    
+    with _monitor_lock:
+        if top and top > 0:
+            processes = process_monitor.get_snapshot().top_by_cpu(top).to_dicts()
+            if columns:
+                processes = [{column: row[column] for column in columns} for row in processes]
+        else:
+            processes = process_monitor.get_processes(columns)
     return jsonify({'processes': processes})
 
 @app.route('/api/realtime/detect', methods=['GET'])
 def detect_deadlock_realtime():
     """Detect deadlock in real-time mode"""
-    result = process_monitor.detect_deadlock()
-    
-    if result['deadlock_detected']:
-        recovery_options = recovery_module.generate_recovery_options(
-            result['deadlock_processes'],
-            process_monitor.get_detailed_processes(result['deadlock_processes'])
-        )
-        result['recovery_options'] = recovery_options
+    with _monitor_lock:
+        result = process_monitor.detect_deadlock()
+        
+        if result['deadlock_detected']:
+            recovery_options = recovery_module.generate_recovery_options(
+                result['deadlock_processes'],
+                process_monitor.get_detailed_processes(result['deadlock_processes'])
+            )
+            result['recovery_options'] = recovery_options
     
     return jsonify(result)
 
 @app.route('/api/recovery/execute', methods=['POST'])
 def execute_recovery():
     """Execute recovery action"""
-    data = request.json
+    data = _json_body()
     action = data.get('action')
     process_id = data.get('process_id')
     
     # Handle both string IDs (manual mode) and integer PIDs (real-time mode)
-    # Pass deadlock_detector for manual mode to actually update the system
-    result = recovery_module.execute_action(action, process_id, deadlock_detector)
+    # Pass deadlock_detector for manual mode to actually update the system; its lock
+    # is only taken for manual ids, so a real-time terminate (up to 5 s) never
+    # blocks the manual simulation endpoints
+    result = recovery_module.execute_action(action, process_id, deadlock_detector, _detector_lock)
     return jsonify(result)
 
 @app.route('/api/system/stats', methods=['GET'])
 def get_system_stats():
     """Get system statistics"""
     stats = {
-        'cpu_percent': psutil.cpu_percent(interval=1),
+        'cpu_percent': _cpu_percent,
         'memory_percent': psutil.virtual_memory().percent,
         'process_count': len(psutil.pids()),
         'timestamp': datetime.now().isoformat()
@@ -162,4 +237,5 @@ def get_system_stats():
     return jsonify(stats)
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Production WSGI server with a thread pool, so UI polls are served concurrently
+    serve(app, host='0.0.0.0', port=5000, threads=8)
@@ -3,6 +3,18 @@ Banker's Algorithm Implementation for Deadlock Prevention
 Predicts if system will be in safe state before granting resources
 """
 
+from collections import defaultdict, deque
+
+import numpy as np
+
+# SWAR fast path: up to 8 resources packed as 8-bit lanes of a single integer.
+# Lane values stay <= 127 so the high bit of each lane is free for the compare.
+_LANE_BITS = 8
+_MAX_PACKED_RESOURCES = 8
+_MAX_LANE_VALUE = 127
+_LANE_HIGH_BITS = 0x8080808080808080
+
+
 class BankerAlgorithm:
     """
     Implements Banker's Algorithm for deadlock avoidance
@@ -15,11 +27,26 @@ class BankerAlgorithm:
         self.allocation = {}  # Currently allocated resources
         self.need = {}  # Remaining need for each process
         self.available = {}  # Available resources
+        
+        # NumPy mirrors of the matrices above, rebuilt lazily when dirty
+        self._proc_ids = []  # Row index -> process id
+        self._proc_index = {}  # Process id -> row index
+        self._res_index = {}  # Resource id -> column index
+        self._alloc_np = None
+        self._need_np = None
+        self._avail_np = None
+        self._need_packed = None  # SWAR-packed rows, None when the system is too large to pack
+        self._alloc_packed = None
+        self._avail_packed = None
+        self._dirty = True
     
     def initialize(self, processes, resources):
         """Initialize Banker's Algorithm with processes and resources"""
         self.processes = processes
         self.resources = resources
+        self.allocation = {}
+        self.need = {}
+        self.max_need = {}
         
         # Initialize matrices
         for proc_id in processes:
@@ -36,6 +63,37 @@ class BankerAlgorithm:
         self.available = {}
         for res_id, resource in resources.items():
             self.available[res_id] = resource.get('instances', 1)
+        
+        self._dirty = True
+    
+    def add_process(self, process_id):
+        """Add matrix rows for a new process without rebuilding existing ones"""
+        self.processes.setdefault(process_id, {})
+        self.allocation[process_id] = {res_id: 0 for res_id in self.resources}
+        self.max_need[process_id] = {
+            res_id: resource.get('instances', 1) for res_id, resource in self.resources.items()
+        }
+        self.need[process_id] = dict(self.max_need[process_id])
+        self._dirty = True
+    
+    def add_resource(self, resource_id, instances=1):
+        """Add a matrix column for a new resource without rebuilding existing ones"""
+        self.resources.setdefault(resource_id, {'instances': instances})
+        for proc_id in self.allocation:
+            self.allocation[proc_id][resource_id] = 0
+            self.max_need[proc_id][resource_id] = instances
+            self.need[proc_id][resource_id] = instances
+        self.available[resource_id] = instances
+        self._dirty = True
+    
+    def remove_process(self, process_id):
+        """Drop a process's rows and return its allocation to the available pool"""
+        self.processes.pop(process_id, None)
+        for res_id, amount in self.allocation.pop(process_id, {}).items():
+            self.available[res_id] = self.available.get(res_id, 0) + amount
+        self.need.pop(process_id, None)
+        self.max_need.pop(process_id, None)
+        self._dirty = True
     
     def update_allocation(self, process_id, resource_id, amount=1):
         """Update allocation when resource is allocated to process"""
@@ -45,54 +103,150 @@ class BankerAlgorithm:
         self.allocation[process_id][resource_id] += amount
         self.need[process_id][resource_id] = max(0, self.need[process_id][resource_id] - amount)
         self.available[resource_id] = max(0, self.available[resource_id] - amount)
+        self._dirty = True
         return True
     
-    def check_safe_state(self):
+    def _sync_arrays(self):
+        """Rebuild the NumPy allocation/need/available matrices if state changed"""
+        if not self._dirty:
+            return
+        
+        self._proc_ids = list(self.processes)
+        res_ids = list(self.resources)
+        self._proc_index = {proc_id: i for i, proc_id in enumerate(self._proc_ids)}
+        self._res_index = {res_id: j for j, res_id in enumerate(res_ids)}
+        
+        # Instance counts are small, so int16 usually fits and halves the footprint
+        max_instances = max((res.get('instances', 1) for res in self.resources.values()), default=0)
+        dtype = np.int16 if max_instances <= np.iinfo(np.int16).max else np.int32
+        
+        shape = (len(self._proc_ids), len(res_ids))
+        self._alloc_np = np.zeros(shape, dtype=dtype)
+        self._need_np = np.zeros(shape, dtype=dtype)
+        for i, proc_id in enumerate(self._proc_ids):
+            allocation = self.allocation.get(proc_id, {})
+            need = self.need.get(proc_id, {})
+            self._alloc_np[i] = [allocation.get(res_id, 0) for res_id in res_ids]
+            self._need_np[i] = [need.get(res_id, 0) for res_id in res_ids]
+        
+        self._avail_np = np.array([self.available.get(res_id, 0) for res_id in res_ids], dtype=dtype)
+        self._pack_arrays()
+        self._dirty = False
+    
+    def _pack_arrays(self):
         """
-        Check if system is in safe state using Banker's Algorithm
-        Returns: (is_safe, safe_sequence, details)
+        Pack need/allocation rows into 8-bit lanes of one integer (SWAR) when
+        there are at most 8 resources and every count stays within 7 bits.
+        Work only ever grows up to the per-resource total, so lanes never overflow.
         """
+        self._need_packed = self._alloc_packed = self._avail_packed = None
+        
+        num_resources = self._avail_np.shape[0]
+        if num_resources > _MAX_PACKED_RESOURCES:
+            return
+        column_totals = self._alloc_np.sum(axis=0) + self._avail_np
+        if (column_totals > _MAX_LANE_VALUE).any() or (self._need_np > _MAX_LANE_VALUE).any():
+            return
+        if (self._need_np < 0).any() or (self._alloc_np < 0).any() or (self._avail_np < 0).any():
+            return
+        
+        shifts = np.arange(num_resources, dtype=np.uint64) * np.uint64(_LANE_BITS)
+        self._need_packed = (self._need_np.astype(np.uint64) << shifts).sum(axis=1).tolist()
+        self._alloc_packed = (self._alloc_np.astype(np.uint64) << shifts).sum(axis=1).tolist()
+        self._avail_packed = int((self._avail_np.astype(np.uint64) << shifts).sum())
+    
+    def _shift_cell(self, i, j, amount):
+        """Move `amount` units of resource column j from available to process row i"""
+        self._alloc_np[i, j] += amount
+        self._need_np[i, j] -= amount
+        self._avail_np[j] -= amount
+        
+        if self._need_packed is not None:
+            lane_amount = amount << (_LANE_BITS * j)
+            self._alloc_packed[i] += lane_amount
+            self._need_packed[i] -= lane_amount
+            self._avail_packed -= lane_amount
+    
+    def _safe_order_packed(self):
+        """Safe-sequence search on SWAR-packed rows; returns (row order, final work per column)"""
+        need = self._need_packed
+        allocation = self._alloc_packed
+        work = self._avail_packed
+        order = []
+        
+        pending = range(len(need))
+        while pending:
+            blocked = []
+            for i in pending:
+                # Every lane of work >= need <=> every lane high bit survives the subtraction
+                if ((work | _LANE_HIGH_BITS) - need[i]) & _LANE_HIGH_BITS == _LANE_HIGH_BITS:
+                    work += allocation[i]
+                    order.append(i)
+                else:
+                    blocked.append(i)
+            if len(blocked) == len(pending):
+                break
+            pending = blocked
+        
+        lane_mask = (1 << _LANE_BITS) - 1
+        final_work = [(work >> (_LANE_BITS * j)) & lane_mask for j in range(len(self._res_index))]
+        return order, final_work
+    
+    def _safe_order_numpy(self):
+        """Safe-sequence search on the NumPy matrices; returns (row order, final work per column)"""
+        need = self._need_np
+        allocation = self._alloc_np
+        
         # Make copies for simulation
-        work = self.available.copy()
-        finish = {proc_id: False for proc_id in self.processes}
-        safe_sequence = []
+        work = self._avail_np.astype(np.int64)
+        order = []
         
-        # Try to find safe sequence
-        iterations = 0
-        max_iterations = len(self.processes) * 2
+        # Worklist of processes that can finish right now
+        queued = (need <= work).all(axis=1)
+        worklist = deque(np.flatnonzero(queued).tolist())
         
-        while len(safe_sequence) < len(self.processes) and iterations < max_iterations:
-            iterations += 1
-            found = False
-            
-            for proc_id in self.processes:
-                if finish[proc_id]:
-                    continue
-                
-                # Check if process can finish with available resources
-                can_finish = True
-                for res_id in self.resources:
-                    if self.need[proc_id][res_id] > work.get(res_id, 0):
-                        can_finish = False
-                        break
-                
-                if can_finish:
-                    # Process can finish, release its resources
-                    for res_id in self.resources:
-                        work[res_id] = work.get(res_id, 0) + self.allocation[proc_id][res_id]
-                    
-                    finish[proc_id] = True
-                    safe_sequence.append(proc_id)
-                    found = True
-                    break
+        # Inverted index: resource column -> blocked processes short on it.
+        # A blocked process can only become runnable once one of these grows.
+        blocked_on = defaultdict(list)
+        for i, j in zip(*np.nonzero(need > work)):
+            blocked_on[int(j)].append(int(i))
+        
+        while worklist:
+            # Process can finish, release its resources
+            i = worklist.popleft()
+            released = allocation[i]
+            work += released
+            order.append(i)
             
-            if not found:
-                break
+            # Re-test only blocked processes waiting on the released resources
+            pending = sorted({k for j in np.flatnonzero(released).tolist()
+                              for k in blocked_on[j] if not queued[k]})
+            if pending:
+                pending = np.array(pending)
+                ready = pending[(need[pending] <= work).all(axis=1)]
+                queued[ready] = True
+                worklist.extend(ready.tolist())
+        
+        return order, work.tolist()
+    
+    def check_safe_state(self):
+        """
+        Check if system is in safe state using Banker's Algorithm
+        Returns: (is_safe, safe_sequence, details)
+        """
+        self._sync_arrays()
+        
+        if self._need_packed is not None:
+            order, final_work = self._safe_order_packed()
+        else:
+            order, final_work = self._safe_order_numpy()
         
-        is_safe = len(safe_sequence) == len(self.processes)
+        safe_sequence = [self._proc_ids[i] for i in order]
+        is_safe = len(safe_sequence) == len(self._proc_ids)
         
-        # Generate detailed explanation
-        details = self._generate_safe_state_details(is_safe, safe_sequence, work)
+        # Generate detailed explanation (_res_index is in column order)
+        final_work = dict(zip(self._res_index, final_work))
+        details = self._generate_safe_state_details(is_safe, safe_sequence, final_work)
         
         return is_safe, safe_sequence, details
     
@@ -101,31 +255,31 @@ class BankerAlgorithm:
         Predict if allocating resource would keep system in safe state
         Returns: (is_safe, message, safe_sequence)
         """
+        # Read need/available by row/column index instead of nested dict lookups
+        self._sync_arrays()
+        i = self._proc_index.get(process_id)
+        j = self._res_index.get(resource_id)
+        need = int(self._need_np[i, j]) if i is not None and j is not None else 0
+        available = int(self._avail_np[j]) if j is not None else 0
+        
         # Check if request exceeds need
-        if self.need.get(process_id, {}).get(resource_id, 0) < amount:
+        if need < amount:
             return False, f"Request exceeds maximum need for {process_id}", []
         
         # Check if resources are available
-        if self.available.get(resource_id, 0) < amount:
-            return False, f"Insufficient resources available. Need {amount}, have {self.available.get(resource_id, 0)}", []
-        
-        # Simulate allocation
-        old_allocation = self.allocation[process_id][resource_id]
-        old_need = self.need[process_id][resource_id]
-        old_available = self.available[resource_id]
+        if available < amount:
+            return False, f"Insufficient resources available. Need {amount}, have {available}", []
         
+        # Simulate allocation directly on the matrices
         # Temporarily allocate
-        self.allocation[process_id][resource_id] += amount
-        self.need[process_id][resource_id] -= amount
-        self.available[resource_id] -= amount
+        self._shift_cell(i, j, amount)
         
         # Check if still in safe state
-        is_safe, safe_sequence, details = self.check_safe_state()
-        
-        # Restore original state
-        self.allocation[process_id][resource_id] = old_allocation
-        self.need[process_id][resource_id] = old_need
-        self.available[resource_id] = old_available
+        try:
+            is_safe, safe_sequence, details = self.check_safe_state()
+        finally:
+            # Restore original state
+            self._shift_cell(i, j, -amount)
         
         if is_safe:
             return True, f"✅ Safe to allocate! System remains in safe state. Safe sequence: {' → '.join(safe_sequence)}", safe_sequence
@@ -172,14 +326,31 @@ class BankerAlgorithm:
         
         return min(100, int(risk))
     
+    def _risk_scores(self):
+        """Risk scores for all processes in one vectorized pass (same formula as calculate_risk_score)"""
+        self._sync_arrays()
+        
+        max_possible = max(len(self.resources) * 2, 1)
+        total_allocated = self._alloc_np.sum(axis=1)
+        total_need = self._need_np.sum(axis=1)
+        total_available = int(self._avail_np.sum())
+        
+        risk = (total_allocated / max_possible) * 30 + (total_need / max_possible) * 40
+        risk += np.where(
+            total_available < total_need,
+            30,
+            (1 - (total_available - total_need) / max(total_available, 1)) * 30
+        )
+        
+        scores = np.minimum(100, risk.astype(np.int64))
+        return dict(zip(self._proc_ids, scores.tolist()))
+    
     def get_system_state(self):
         """Get complete system state for visualization"""
         is_safe, safe_sequence, details = self.check_safe_state()
         
         # Calculate risk scores for all processes
-        risk_scores = {}
-        for proc_id in self.processes:
-            risk_scores[proc_id] = self.calculate_risk_score(proc_id)
+        risk_scores = self._risk_scores()
         
         return {
             'is_safe': is_safe,
@@ -1,5 +1,13 @@
+from collections import Counter, defaultdict
+
 from banker_algorithm import BankerAlgorithm
 
+# DFS node colors: unvisited, on the current path, fully explored
+WHITE, GRAY, BLACK = 0, 1, 2
+
+# RAG ke andar nodes (kind, id) tuples hain, taaki process aur resource ids kabhi collide na karein
+PROCESS, RESOURCE = 'P', 'R'
+
 class DeadlockDetector:
     """
     Deadlock detection algorithms implement karta hai:
@@ -10,10 +18,22 @@ class DeadlockDetector:
     def __init__(self):
         self.processes = {}  # {process_id: {name, allocated, requested}} — process ka data
         self.resources = {}  # {resource_id: {name, instances, available}} — resource ka data
-        self.allocation = {}  # {process_id: [resource_ids]} — allocation mapping
-        self.request = {}     # {process_id: [resource_ids]} — request mapping
-        self.edges = []       # [(from, to, type)] — graph visualization ke liye edges
+        self.allocation = {}  # {process_id: Counter({resource_id: instances})} — allocation mapping
+        self.request = {}     # {process_id: {resource_ids}} — request mapping
+        self.edges = {}       # {edge_id: (from, to, type)} — graph visualization ke liye edges
+        self._node_edges = defaultdict(set)  # {(kind, id): {edge_ids}} — node se jude edges
+        self._next_edge_id = 0
+        self._adj = defaultdict(list)  # {(kind, id): [(kind, id)]} — RAG adjacency list, incrementally maintained
+        self._has_cycle = False  # True/False agar pata hai, None agar full DFS chahiye
+        self._total_allocated = 0  # Abhi tak allocated instances ka total
         self.banker = BankerAlgorithm()  # Banker's Algorithm prediction ke liye
+        self.banker.initialize(self.processes, self.resources)
+        
+        # Har mutation pe version badhta hai; cached results tabhi reuse hote hain jab version same ho
+        self._state_version = 0
+        self._detect_cache = (None, -1)   # (detect_deadlock result, version)
+        self._state_cache = (None, -1)    # (predict_deadlock result, version)
+        self._graph_cache = (None, -1)    # (get_graph_data result, version)
     
     def reset(self):
         """Sab data structures ko reset karo"""
@@ -21,7 +41,14 @@ class DeadlockDetector:
         self.resources = {}
         self.allocation = {}
         self.request = {}
-        self.edges = []
+        self.edges = {}
+        self._node_edges = defaultdict(set)
+        self._next_edge_id = 0
+        self._adj = defaultdict(list)
+        self._has_cycle = False
+        self._total_allocated = 0
+        self.banker.initialize(self.processes, self.resources)
+        self._state_version += 1
     
     def add_process(self, process_id, process_name):
         """Naya process add karo"""
@@ -31,13 +58,12 @@ class DeadlockDetector:
             'allocated': [],
             'requested': []
         }
-        self.allocation[process_id] = []
-        self.request[process_id] = []
+        self.allocation[process_id] = Counter()
+        self.request[process_id] = set()
+        self._state_version += 1
         
-        # Update Banker's Algorithm
-        if len(self.resources) > 0:
-            # Agar resources present hain toh Banker ko initialize karo
-            self.banker.initialize(self.processes, self.resources)
+        # Banker ke matrices me sirf nayi row jodo, baaki ko rebuild mat karo
+        self.banker.add_process(process_id)
     
     def add_resource(self, resource_id, resource_name, instances=1):
         """Naya resource add karo"""
@@ -47,11 +73,10 @@ class DeadlockDetector:
             'instances': instances,
             'available': instances
         }
+        self._state_version += 1
         
-        # Update Banker's Algorithm
-        if len(self.processes) > 0:
-            # Agar processes already hain toh Banker ko initialize karo
-            self.banker.initialize(self.processes, self.resources)
+        # Banker ke matrices me sirf naya column jodo
+        self.banker.add_resource(resource_id, instances)
     
     def allocate_resource(self, process_id, resource_id):
         """Resource ko process ko allocate karo"""
@@ -59,15 +84,19 @@ class DeadlockDetector:
             return False
         
         if self.resources[resource_id]['available'] > 0:
-            self.allocation[process_id].append(resource_id)
+            self.allocation[process_id][resource_id] += 1
             self.processes[process_id]['allocated'].append(resource_id)
             self.resources[resource_id]['available'] -= 1
+            self._total_allocated += 1
             
             # Banker's Algorithm ko update karo
             self.banker.update_allocation(process_id, resource_id, 1)
             
-            # Edge add karo: Resource -> Process (allocation)
-            self.edges.append((resource_id, process_id, 'allocation'))
+            # Edge add karo: Resource -> Process (allocation) - sirf pehle instance pe,
+            # cycle detection ke liye simple graph kaafi hai
+            if self.allocation[process_id][resource_id] == 1:
+                self._add_edge(process_id, resource_id, 'allocation')
+            self._state_version += 1
             return True
         return False
     
@@ -76,76 +105,88 @@ class DeadlockDetector:
         if process_id not in self.processes or resource_id not in self.resources:
             return False
         
-        self.request[process_id].append(resource_id)
+        # Same request dobara aaye (client retry) toh duplicate edge mat banao
+        if resource_id in self.request[process_id]:
+            return True
+        
+        self.request[process_id].add(resource_id)
         self.processes[process_id]['requested'].append(resource_id)
         
         # Edge add karo: Process -> Resource (request)
-        self.edges.append((process_id, resource_id, 'request'))
+        self._add_edge(process_id, resource_id, 'request')
+        self._state_version += 1
         return True
     
+    def _add_edge(self, process_id, resource_id, edge_type):
+        """
+        Graph me edge jodo aur check karo ki isse naya cycle bana ya nahi
+        Naya cycle tabhi banega jab target se wapas source tak path ho
+        """
+        process_node = (PROCESS, process_id)
+        resource_node = (RESOURCE, resource_id)
+        edge_id = self._next_edge_id
+        self._next_edge_id += 1
+        if edge_type == 'allocation':
+            # Resource -> Process
+            self.edges[edge_id] = (resource_id, process_id, edge_type)
+            source, target = resource_node, process_node
+        else:
+            # Process -> Resource
+            self.edges[edge_id] = (process_id, resource_id, edge_type)
+            source, target = process_node, resource_node
+        self._node_edges[process_node].add(edge_id)
+        self._node_edges[resource_node].add(edge_id)
+        
+        self._adj[source].append(target)
+        if self._has_cycle is False and self._reaches(target, source):
+            self._has_cycle = True
+    
+    def _reaches(self, start, goal):
+        """Check karo ki start node se goal node tak koi path hai ya nahi"""
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node == goal:
+                return True
+            for neighbor in self._adj.get(node, []):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+        return False
+    
     def detect_deadlock(self):
         """
         RAG me cycle detect karke deadlock detect karo
         DFS use karke graph me cycles dhundo
         """
-        # Build adjacency list for the graph
-        graph = {}
-        all_nodes = set(self.processes.keys()) | set(self.resources.keys())
-        
-        for node in all_nodes:
-            graph[node] = []
-        
-        # Graph build kar rahe hain:
-        # 1. Process -> Resource (request edge): Process resource ka wait kar raha hai
-        # 2. Resource -> Process (allocation edge): Resource kisi process ke paas hai
-        for process_id in self.processes:
-            # Request edges: Process -> Resource
-            for resource_id in self.request[process_id]:
-                graph[process_id].append(resource_id)
-            
-            # Allocation edges: Resource -> Process (reverse direction)
-            for resource_id in self.allocation[process_id]:
-                graph[resource_id].append(process_id)
-        
-        # DFS se cycle detect karne ka function
-        def has_cycle_dfs(node, visited, rec_stack, path):
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-            
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    result = has_cycle_dfs(neighbor, visited, rec_stack, path)
-                    if result:  # Agar cycle mil gayi toh upar propagate karo
-                        return result
-                elif neighbor in rec_stack:
-                    # Cycle detect hui! Cycle nikal lo
-                    cycle_start_idx = path.index(neighbor)
-                    cycle = path[cycle_start_idx:] + [neighbor]
-                    return cycle
-            
-            path.pop()
-            rec_stack.remove(node)
-            return None
-        
-        # Sab nodes ko check karo cycles ke liye
-        visited = set()
-        for node in all_nodes:
-            if node not in visited:
-                rec_stack = set()
-                path = []
-                cycle = has_cycle_dfs(node, visited, rec_stack, path)
-                if cycle:
-                    # Deadlock me involved processes nikal lo
-                    deadlock_processes = [n for n in cycle if n in self.processes]
-                    cycle_str = ' → '.join([str(n) for n in cycle])
-                    
-                    return {
-                        'deadlock_detected': True,
-                        'deadlock_cycle': cycle,
-                        'deadlock_processes': deadlock_processes,
-                        'message': f'Deadlock detected! Cycle: {cycle_str}'
-                    }
+        # Pichli call ke baad kuch nahi badla toh wahi result do
+        result, version = self._detect_cache
+        if version != self._state_version:
+            result = self._compute_deadlock()
+            self._detect_cache = (result, self._state_version)
+        # Copy do taaki caller (e.g. recovery options jodna) cache ko modify na kare
+        return dict(result)
+    
+    def _compute_deadlock(self):
+        """Cache miss pe RAG ka actual cycle check"""
+        # Adjacency list allocate/request ke time pe hi update hoti hai.
+        # Agar kisi naye edge ne cycle nahi banaya toh full DFS ki zarurat nahi.
+        if self._has_cycle is not False:
+            cycle = self._search_cycle()
+            self._has_cycle = cycle is not None
+            if cycle:
+                # Deadlock me involved processes nikal lo - kind tag se, koi dict lookup nahi
+                deadlock_processes = [n[1] for n in cycle if n[0] == PROCESS]
+                cycle = [n[1] for n in cycle]
+                cycle_str = ' → '.join([str(n) for n in cycle])
+                
+                return {
+                    'deadlock_detected': True,
+                    'deadlock_cycle': cycle,
+                    'deadlock_processes': deadlock_processes,
+                    'message': f'Deadlock detected! Cycle: {cycle_str}'
+                }
         
         return {
             'deadlock_detected': False,
@@ -154,26 +195,89 @@ class DeadlockDetector:
             'message': 'No deadlock detected. System is in safe state.'
         }
     
+    def _search_cycle(self):
+        """Poore RAG me DFS chala ke pehla cycle lo (None agar koi cycle nahi)"""
+        # Graph edges:
+        # 1. Process -> Resource (request edge): Process resource ka wait kar raha hai
+        # 2. Resource -> Process (allocation edge): Resource kisi process ke paas hai
+        # RAG bipartite hai, toh har cycle kisi process se guzregi - sirf processes se DFS start karo.
+        # Jis process ka koi outgoing (request) edge nahi woh cycle me ho hi nahi sakta.
+        roots = [node for node, neighbors in self._adj.items() if neighbors and node[0] == PROCESS]
+        color = {}
+        parent = {}
+        for node in roots:
+            if color.get(node, WHITE) == WHITE:
+                cycle = self._find_cycle(self._adj, node, color, parent)
+                if cycle:
+                    return cycle
+        return None
+    
+    @staticmethod
+    def _find_cycle(graph, start, color, parent):
+        """
+        Iterative DFS (white/gray/black marking) jo start se reachable cycle dhundta hai
+        Recursion limit ka issue nahi, aur cycle parent pointers se O(cycle length) me nikalti hai
+        """
+        color[start] = GRAY
+        stack = [(start, iter(graph.get(start, [])))]
+        
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:
+                state = color.get(neighbor, WHITE)
+                if state == GRAY:
+                    # Back edge mila - cycle detect hui! Parent chain se cycle nikal lo
+                    cycle = [node]
+                    while cycle[-1] != neighbor:
+                        cycle.append(parent[cycle[-1]])
+                    cycle.reverse()
+                    cycle.append(neighbor)
+                    return cycle
+                if state == WHITE:
+                    color[neighbor] = GRAY
+                    parent[neighbor] = node
+                    stack.append((neighbor, iter(graph.get(neighbor, []))))
+                    break
+            else:
+                # Saare neighbors explore ho gaye
+                color[node] = BLACK
+                stack.pop()
+        
+        return None
+    
     def remove_process(self, process_id):
         """Process remove karo (recovery simulation ke liye)"""
         if process_id in self.processes:
             # Is process ke paas jo resources hain unko release karo
-            for resource_id in self.allocation.get(process_id, []):
+            for resource_id, count in self.allocation.get(process_id, {}).items():
                 if resource_id in self.resources:
-                    self.resources[resource_id]['available'] += 1
+                    self.resources[resource_id]['available'] += count
+                self._total_allocated -= count
             
-            # Process se related edges hata do
-            self.edges = [edge for edge in self.edges if edge[0] != process_id and edge[1] != process_id]
+            # Process se related edges hata do - sirf is process ke edges, O(degree)
+            process_node = (PROCESS, process_id)
+            for edge_id in self._node_edges.pop(process_node, ()):
+                source, target, edge_type = self.edges.pop(edge_id)
+                resource_id = source if edge_type == 'allocation' else target
+                self._node_edges[(RESOURCE, resource_id)].discard(edge_id)
+            self._adj.pop(process_node, None)
+            for resource_id in self.allocation.get(process_id, {}):
+                resource_node = (RESOURCE, resource_id)
+                self._adj[resource_node] = [n for n in self._adj[resource_node] if n != process_node]
+            
+            # Edges hatne se cycle toot sakta hai, naya nahi banta
+            if self._has_cycle:
+                self._has_cycle = None
             
             # Data structures se remove karo
             del self.processes[process_id]
             del self.allocation[process_id]
             del self.request[process_id]
             
-            # Banker ko dobara initialize karo agar kuch processes/resources bache hain
-            if len(self.processes) > 0 and len(self.resources) > 0:
-                self.banker.initialize(self.processes, self.resources)
+            # Banker se bhi process ki row hatao aur uske resources wapas available karo
+            self.banker.remove_process(process_id)
             
+            self._state_version += 1
             return True
         return False
     
@@ -182,6 +286,15 @@ class DeadlockDetector:
         Banker's Algorithm se predict karo ki system safe hai ya nahi
         Returns prediction analysis
         """
+        # Banker ka state tabhi dobara compute karo jab system badla ho
+        result, version = self._state_cache
+        if version != self._state_version:
+            result = self._compute_prediction()
+            self._state_cache = (result, self._state_version)
+        return dict(result)
+    
+    def _compute_prediction(self):
+        """Cache miss pe Banker's Algorithm chala ke prediction banao"""
         if len(self.processes) == 0 or len(self.resources) == 0:
             return {
                 'is_safe': True,
@@ -190,6 +303,16 @@ class DeadlockDetector:
                 'risk_level': 'low'
             }
         
+        # Koi allocation nahi hai toh har process ka need available me fit hoga - system trivially safe
+        if self._total_allocated == 0:
+            safe_sequence = list(self.processes.keys())
+            return {
+                'is_safe': True,
+                'message': f"✅ System is in SAFE state. Safe sequence exists: {' → '.join(safe_sequence)}",
+                'safe_sequence': safe_sequence,
+                'risk_level': 'low'
+            }
+        
         # Banker's Algorithm se system state lo
         state = self.banker.get_system_state()
         
@@ -235,6 +358,11 @@ class DeadlockDetector:
     
     def get_graph_data(self):
         """Visualization ke liye graph data do"""
+        # UI har poll pe graph mangta hai; state nahi badli toh pehle se bana graph do
+        graph, version = self._graph_cache
+        if version == self._state_version:
+            return graph
+        
         nodes = []
         links = []
         
@@ -256,7 +384,7 @@ class DeadlockDetector:
             })
         
         # Edges add karo
-        for edge in self.edges:
+        for edge in self.edges.values():
             from_node, to_node, edge_type = edge
             links.append({
                 'source': from_node,
@@ -264,4 +392,6 @@ class DeadlockDetector:
                 'type': edge_type
             })
         
-        return {'nodes': nodes, 'links': links}
+        graph = {'nodes': nodes, 'links': links}
+        self._graph_cache = (graph, self._state_version)
+        return graph
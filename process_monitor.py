@@ -1,94 +1,423 @@
 import psutil
 import os
-from collections import defaultdict
+import time
+from collections import namedtuple
+from dataclasses import dataclass
+
+import numpy as np
+
+import procscan
+
+# Process states that count as waiting for deadlock analysis
+WAITING_STATUSES = ('waiting', 'sleeping', 'disk-sleep')
+
+# Parent-child edge in the process dependency graph
+DependencyEdge = namedtuple('DependencyEdge', 'child parent name')
+
+
+@dataclass
+class ProcessRow:
+    """
+    One row of the process listing
+    __slots__ keeps rows smaller and cheaper to build than dicts; orjson
+    serializes them as JSON objects. Floats are left unrounded for the UI to format.
+    """
+    __slots__ = ('pid', 'name', 'username', 'cpu_percent', 'memory_percent',
+                 'status', 'num_threads', 'type')
+    pid: int
+    name: str
+    username: str
+    cpu_percent: float
+    memory_percent: float
+    status: str
+    num_threads: int
+    type: str
+
+
+# Columns a process listing can be limited to; 'type' is derived, the rest are psutil attributes
+PROCESS_COLUMNS = ProcessRow.__slots__
+
+
+@dataclass
+class ProcessSnapshot:
+    """
+    Column-oriented (SoA) snapshot of running processes
+    Numeric columns are NumPy arrays so sorting and filtering stay vectorized
+    """
+    pids: np.ndarray          # int32
+    names: np.ndarray         # object
+    usernames: np.ndarray     # object
+    cpu: np.ndarray           # float32
+    mem: np.ndarray           # float32
+    status: np.ndarray        # object
+    num_threads: np.ndarray   # int32
+    types: np.ndarray         # object
+    
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a snapshot from ProcessRow objects"""
+        pids, names, usernames, cpu, mem, status, num_threads, types = [], [], [], [], [], [], [], []
+        for row in rows:
+            pids.append(row.pid)
+            names.append(row.name)
+            usernames.append(row.username)
+            cpu.append(row.cpu_percent)
+            mem.append(row.memory_percent)
+            status.append(row.status)
+            num_threads.append(row.num_threads)
+            types.append(row.type)
+        
+        return cls(
+            pids=np.array(pids, dtype=np.int32),
+            names=np.array(names, dtype=object),
+            usernames=np.array(usernames, dtype=object),
+            cpu=np.array(cpu, dtype=np.float32),
+            mem=np.array(mem, dtype=np.float32),
+            status=np.array(status, dtype=object),
+            num_threads=np.array(num_threads, dtype=np.int32),
+            types=np.array(types, dtype=object)
+        )
+    
+    def __len__(self):
+        return len(self.pids)
+    
+    def take(self, indices):
+        """New snapshot with only the given rows (index array or boolean mask)"""
+        return ProcessSnapshot(
+            pids=self.pids[indices],
+            names=self.names[indices],
+            usernames=self.usernames[indices],
+            cpu=self.cpu[indices],
+            mem=self.mem[indices],
+            status=self.status[indices],
+            num_threads=self.num_threads[indices],
+            types=self.types[indices]
+        )
+    
+    def top_by_cpu(self, n):
+        """The n processes with the highest CPU usage, busiest first"""
+        if n >= len(self):
+            return self.take(np.argsort(-self.cpu, kind='stable'))
+        top = np.argpartition(-self.cpu, n - 1)[:n]
+        return self.take(top[np.argsort(-self.cpu[top], kind='stable')])
+    
+    def filter_waiting(self):
+        """Processes in a waiting state with low CPU and several threads"""
+        mask = np.isin(self.status, WAITING_STATUSES) & (self.cpu < 1.0) & (self.num_threads >= 2)
+        return self.take(mask)
+    
+    def to_dicts(self):
+        """Row dicts with the same fields as ProcessRow, for JSON (float32 noise rounded off)"""
+        return [
+            {
+                'pid': pid,
+                'name': name,
+                'username': username,
+                'cpu_percent': cpu,
+                'memory_percent': mem,
+                'status': status,
+                'num_threads': num_threads,
+                'type': process_type
+            }
+            for pid, name, username, cpu, mem, status, num_threads, process_type in zip(
+                self.pids.tolist(), self.names.tolist(), self.usernames.tolist(),
+                np.round(self.cpu.astype(np.float64), 2).tolist(),
+                np.round(self.mem.astype(np.float64), 2).tolist(),
+                self.status.tolist(), self.num_threads.tolist(), self.types.tolist()
+            )
+        ]
+
 
 class ProcessMonitor:
     """
     Monitor real-time Windows processes and detect potential deadlocks
     """
     
-    # Critical system processes that should not be terminated
-    CRITICAL_SYSTEM_PROCESSES = {
+    # Critical system processes that should not be terminated (lowercase names)
+    CRITICAL_SYSTEM_PROCESSES = frozenset({
         'csrss.exe', 'smss.exe', 'wininit.exe', 'services.exe',
         'lsass.exe', 'winlogon.exe', 'dwm.exe', 'system'
-    }
+    })
     
-    # Non-critical but important system processes
-    SYSTEM_PROCESSES = {
+    # Non-critical but important system processes (lowercase names)
+    SYSTEM_PROCESSES = frozenset({
         'explorer.exe', 'svchost.exe', 'taskhost.exe', 'taskhostw.exe',
         'spoolsv.exe', 'searchindexer.exe'
-    }
+    })
+    
+    # Name -> class in one lookup; critical wins if a name were in both sets
+    _NAME_CLASS = {**dict.fromkeys(SYSTEM_PROCESSES, 'system'),
+                   **dict.fromkeys(CRITICAL_SYSTEM_PROCESSES, 'critical')}
+    
+    # Case-folded fragments of service account names
+    _SYSTEM_USER_TOKENS = ('system', 'local service')
+    
+    # Drop classification cache entries for exited processes every N scans
+    CLASSIFY_PRUNE_INTERVAL = 10
     
     def __init__(self):
         self.monitored_processes = {}
+        self._classify_cache = {}  # (pid, create_time) -> 'critical' / 'system' / 'user'
+        self._scans_since_prune = 0
+        self._proc_pool = {}  # pid -> (Process, start time it was pooled with), reused by every scan
+        self._deps_cache = (None, None)  # (pid set fingerprint, dependency edges)
+        # Open /proc/<pid>/stat descriptors reused by every deadlock scan (Linux only)
+        self._stat_reader = procscan.StatReader() if procscan.AVAILABLE else None
     
     def is_system_process(self, process):
         """
         Determine if a process is a system process
         Returns: 'critical', 'system', or 'user'
         """
+        # A process's name, user and exe never change, so classify each one only once.
+        # create_time is part of the key so a reused pid is classified afresh.
         try:
-            name = process.name().lower()
-            
-            # Check critical system processes
-            if name in self.CRITICAL_SYSTEM_PROCESSES:
-                return 'critical'
-            
-            # Check system processes
-            if name in self.SYSTEM_PROCESSES:
-                return 'system'
+            key = (process.pid, process.create_time())
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            key = None
+        
+        process_type = self._classify_cache.get(key)
+        if process_type is None:
+            process_type = self._classify(process)
+            if key is not None and process_type != 'unknown':
+                self._classify_cache[key] = process_type
+        return process_type
+    
+    def _prune_classify_cache(self):
+        """Forget classifications of processes that have exited, once every few scans"""
+        self._scans_since_prune += 1
+        if self._scans_since_prune < self.CLASSIFY_PRUNE_INTERVAL:
+            return
+        self._scans_since_prune = 0
+        
+        live_pids = set(psutil.pids())
+        self._classify_cache = {
+            key: process_type for key, process_type in self._classify_cache.items()
+            if key[0] in live_pids
+        }
+    
+    def _classify(self, process):
+        """Uncached classification used by is_system_process"""
+        try:
+            # Reuse the name _iter_procs already fetched into .info
+            info = getattr(process, 'info', None) or {}
+            name = (info.get('name') or process.name()).lower()
             
-            # Check if running as SYSTEM user
-            try:
-                username = process.username()
-                if 'SYSTEM' in username.upper() or 'LOCAL SERVICE' in username.upper():
-                    return 'system'
-            except:
-                pass
+            # Check critical and system processes by name
+            process_type = self._NAME_CLASS.get(name)
+            if process_type is not None:
+                return process_type
             
-            # Check if in System32 directory
-            try:
-                exe_path = process.exe()
-                if 'System32' in exe_path or 'system32' in exe_path:
-                    return 'system'
-            except:
-                pass
+            # Unknown name: the username and exe lookups share one oneshot() read
+            with process.oneshot():
+                # Check if running as SYSTEM user
+                try:
+                    username = process.username().casefold()
+                    if any(token in username for token in self._SYSTEM_USER_TOKENS):
+                        return 'system'
+                except:
+                    pass
+                
+                # Check if in System32 directory
+                try:
+                    if 'system32' in process.exe().lower():
+                        return 'system'
+                except:
+                    pass
             
             return 'user'
         except:
             return 'unknown'
     
-    def get_processes(self):
-        """Get all running processes with details"""
-        processes = []
+    def get_processes(self, columns=None):
+        """
+        Get all running processes with details, as ProcessRow objects
+        If columns (names from PROCESS_COLUMNS) is given, return dicts holding only
+        those columns instead. psutil then fetches just those attributes, so fewer
+        columns is roughly proportionally cheaper, and 'type' is only classified
+        when asked for.
+        """
+        if columns is None:
+            return list(self._iter_processes())
+        return list(self._iter_columns(columns))
+    
+    def get_snapshot(self):
+        """Get all running processes as a column-oriented ProcessSnapshot"""
+        return ProcessSnapshot.from_rows(self._iter_processes())
+    
+    def _refresh_pool(self):
+        """
+        Sync self._proc_pool with the running processes and return their Process objects
+        Reusing Process objects keeps psutil's per-object caches (name, exe,
+        create_time) and cpu_percent() baselines between scans. Those caches would
+        be wrong for a pid that exited and was reused, so every entry is checked
+        against the process's current start time and replaced if it changed.
+        On Linux the start times come from one /proc/<pid>/stat pass through the
+        cached descriptors, which is much cheaper than process_iter building a
+        fresh Process per pid for its is_running() check; elsewhere is_running()
+        is used.
+        """
+        if self._stat_reader is not None:
+            stats = self._stat_reader.scan()
+            current = dict(zip(stats['pid'].tolist(), stats['start_ticks'].tolist()))
+        else:
+            current = dict.fromkeys(psutil.pids())
+        
+        pool = self._proc_pool
+        for pid in pool.keys() - current.keys():
+            del pool[pid]
         
-        for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'status', 'num_threads']):
+        procs = []
+        for pid, start in current.items():
+            entry = pool.get(pid)
+            if entry is None or not self._is_same_process(entry, start):
+                try:
+                    entry = pool[pid] = (psutil.Process(pid), start)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pool.pop(pid, None)
+                    continue
+            procs.append(entry[0])
+        return procs
+    
+    def _is_same_process(self, entry, start):
+        """Whether a pool entry still refers to the running process (start from procscan, or None)"""
+        proc, pooled_start = entry
+        if start is not None:
+            return start == pooled_start
+        return proc.is_running()
+    
+    def _get_proc(self, pid):
+        """
+        Pooled Process for pid if it still refers to the running process, else a
+        fresh one; raises NoSuchProcess. Fresh objects are not added to the pool,
+        since only _refresh_pool prunes it (the Linux deadlock scan never does).
+        """
+        entry = self._proc_pool.get(pid)
+        if entry is not None:
+            start = None
+            if self._stat_reader is not None:
+                try:
+                    start = self._stat_reader.read_stat(pid)[3]
+                except (OSError, ValueError, IndexError):
+                    pass  # Gone or unreadable: fall back to is_running()
+            if self._is_same_process(entry, start):
+                return entry[0]
+        return psutil.Process(pid)
+    
+    def _iter_procs(self, attrs):
+        """Yield pooled Process objects with .info filled for attrs, like psutil.process_iter"""
+        for proc in self._refresh_pool():
             try:
-                pinfo = proc.info
-                process_type = self.is_system_process(proc)
+                proc.info = proc.as_dict(attrs)
+            except psutil.NoSuchProcess:
+                self._proc_pool.pop(proc.pid, None)
+                continue
+            except psutil.AccessDenied:
+                continue
+            yield proc
+    
+    def _iter_processes(self):
+        """Yield running processes one row at a time, so callers can filter or stop early"""
+        self._prune_classify_cache()
+        
+        for proc in self._iter_procs(['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'status', 'num_threads']):
+            try:
+                # oneshot() lets the username/exe fallbacks share cached /proc reads
+                with proc.oneshot():
+                    pinfo = proc.info
+                    process_type = self.is_system_process(proc)
                 
-                processes.append({
-                    'pid': pinfo['pid'],
-                    'name': pinfo['name'],
-                    'username': pinfo.get('username', 'N/A'),
-                    'cpu_percent': round(pinfo.get('cpu_percent', 0), 2),
-                    'memory_percent': round(pinfo.get('memory_percent', 0), 2),
-                    'status': pinfo.get('status', 'unknown'),
-                    'num_threads': pinfo.get('num_threads', 0),
-                    'type': process_type
-                })
+                row = ProcessRow(
+                    pinfo['pid'],
+                    pinfo['name'],
+                    pinfo.get('username', 'N/A'),
+                    pinfo.get('cpu_percent') or 0.0,
+                    pinfo.get('memory_percent') or 0.0,
+                    pinfo.get('status', 'unknown'),
+                    pinfo.get('num_threads', 0),
+                    process_type
+                )
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            
+            yield row
+    
+    def _iter_columns(self, columns):
+        """Yield running processes as dicts of the requested columns only"""
+        unknown = set(columns).difference(PROCESS_COLUMNS)
+        if unknown:
+            raise ValueError(f'Unknown process columns: {", ".join(sorted(unknown))}')
+        
+        want_type = 'type' in columns
+        attrs = [column for column in columns if column != 'type']
+        if want_type:
+            self._prune_classify_cache()
+            if 'name' not in attrs:
+                attrs.append('name')  # Classification looks at the name first
+        
+        for proc in self._iter_procs(attrs):
+            try:
+                with proc.oneshot():
+                    pinfo = proc.info
+                    if want_type:
+                        pinfo['type'] = self.is_system_process(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            
+            row = {column: pinfo.get(column) for column in columns}
+            # Same fallbacks as ProcessRow
+            for column in ('cpu_percent', 'memory_percent'):
+                if column in row:
+                    row[column] = row[column] or 0.0
+            yield row
+    
+    def _batch_cpu_percent(self, procs, interval=0.1):
+        """
+        CPU usage for many processes behind a single sleep
+        Reads cpu_times() and a monotonic timestamp for every process, sleeps once,
+        then divides each user + system delta by its own wall-clock delta.
+        Like cpu_percent(), 100 means one fully busy CPU (not divided by CPU count).
+        Returns: {pid: cpu_percent}
+        """
+        before = []
+        for proc in procs:
+            try:
+                times = proc.cpu_times()
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
+            before.append((proc, times.user + times.system, time.monotonic()))
+        
+        if not before:
+            return {}
+        time.sleep(interval)
         
-        return processes
+        cpu_by_pid = {}
+        for proc, cpu_start, started in before:
+            try:
+                times = proc.cpu_times()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            elapsed = time.monotonic() - started
+            cpu_by_pid[proc.pid] = round((times.user + times.system - cpu_start) / elapsed * 100, 1)
+        return cpu_by_pid
     
     def get_detailed_processes(self, pids):
         """Get detailed information for specific processes"""
         detailed = []
         
+        procs = []
         for pid in pids:
             try:
-                proc = psutil.Process(pid)
+                procs.append(self._get_proc(pid))
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        
+        # One shared sampling interval instead of 0.1 s per process
+        cpu_by_pid = self._batch_cpu_percent(procs)
+        
+        for proc in procs:
+            pid = proc.pid
+            try:
                 process_type = self.is_system_process(proc)
                 
                 # Get open files
@@ -108,7 +437,7 @@ class ProcessMonitor:
                     'name': proc.name(),
                     'type': process_type,
                     'status': proc.status(),
-                    'cpu_percent': proc.cpu_percent(interval=0.1),
+                    'cpu_percent': cpu_by_pid.get(pid, 0.0),
                     'memory_percent': proc.memory_percent(),
                     'num_threads': proc.num_threads(),
                     'username': proc.username() if hasattr(proc, 'username') else 'N/A',
@@ -121,72 +450,111 @@ class ProcessMonitor:
         
         return detailed
     
-    def detect_deadlock(self):
+    def _find_suspicious_psutil(self):
         """
-        Detect potential deadlocks in real-time processes
-        This is a simplified detection based on:
-        - Processes in 'waiting' or 'sleeping' state for too long
-        - Circular wait detection using file locks
-        - Thread analysis for waiting threads
+        Waiting processes with low CPU usage and several threads, found through psutil
+        Returns: list of suspicious process dicts
         """
-        waiting_processes = []
-        file_locks = defaultdict(list)  # file -> [pids accessing it]
         suspicious_processes = []
+        candidates = []  # Waiting/sleeping processes whose CPU usage must be sampled
         
         # Find processes that are waiting or have multiple threads in wait state
-        for proc in psutil.process_iter(['pid', 'name', 'status', 'num_threads', 'cpu_percent']):
+        for proc in self._iter_procs(['pid', 'name', 'status', 'num_threads']):
             try:
-                pinfo = proc.info
-                pid = pinfo['pid']
-                
-                # Check if process is waiting/sleeping with low CPU usage
-                if pinfo['status'] in ['waiting', 'sleeping', 'disk-sleep']:
-                    cpu = proc.cpu_percent(interval=0.1)
-                    num_threads = pinfo.get('num_threads', 0)
-                    
-                    # Suspicious: waiting state + low CPU + multiple threads
-                    if cpu < 1.0 and num_threads >= 2:
-                        waiting_processes.append(pid)
-                        suspicious_processes.append({
-                            'pid': pid,
-                            'name': pinfo['name'],
-                            'status': pinfo['status'],
-                            'threads': num_threads,
-                            'cpu': cpu
-                        })
-                
-                # Track file locks
-                try:
-                    for f in proc.open_files():
-                        file_locks[f.path].append(pid)
-                except (psutil.AccessDenied, psutil.NoSuchProcess):
-                    pass
-                
+                if proc.info['status'] in WAITING_STATUSES:
+                    candidates.append(proc)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
         
-        # Check for multiple processes accessing same files
-        potential_deadlock = []
-        for file_path, pids in file_locks.items():
-            if len(pids) > 1:
-                # Multiple processes accessing same file
-                waiting_on_file = [pid for pid in pids if pid in waiting_processes]
-                if len(waiting_on_file) >= 1:
-                    potential_deadlock.extend(waiting_on_file)
+        # Check waiting processes for low CPU usage, sampled together behind one sleep
+        cpu_by_pid = self._batch_cpu_percent(candidates)
+        for proc in candidates:
+            pinfo = proc.info
+            pid = pinfo['pid']
+            if pid not in cpu_by_pid:
+                continue
+            cpu = cpu_by_pid[pid]
+            num_threads = pinfo.get('num_threads', 0)
+            
+            if cpu < 1.0 and num_threads >= 2:
+                suspicious_processes.append({
+                    'pid': pid,
+                    'name': pinfo['name'],
+                    'status': pinfo['status'],
+                    'threads': num_threads,
+                    'cpu': cpu
+                })
+        return suspicious_processes
+    
+    def _find_suspicious_procfs(self, interval=0.1):
+        """
+        Same as _find_suspicious_psutil, but reads /proc/<pid>/stat directly (Linux)
+        through the descriptors cached in self._stat_reader
+        CPU usage is the utime + stime delta over the sleep, as a percentage of one
+        CPU like psutil's cpu_percent()
+        """
+        first = self._stat_reader.scan()
+        started = time.monotonic()
+        
+        # Only waiting processes with several threads can be suspicious, so only
+        # those are read again after the sleep
+        mask = np.isin(first['status'], WAITING_STATUSES) & (first['num_threads'] >= 2)
+        pids = first['pid'][mask]
+        if not len(pids):
+            return []
         
-        # Also check for suspicious waiting processes (like our test script)
-        if len(suspicious_processes) > 0:
-            # Found processes that look like they might be deadlocked
-            potential_deadlock.extend([p['pid'] for p in suspicious_processes])
+        time.sleep(interval)
+        second = self._stat_reader.scan(pids.tolist())
+        elapsed = time.monotonic() - started
+        
+        # Both scans are in pid order; processes that exited meanwhile are missing
+        # from the second one
+        before = np.searchsorted(pids, second['pid'])
+        ticks = second['cpu_ticks'] - first['cpu_ticks'][mask][before]
+        cpu = np.round(ticks / procscan.CLOCK_TICKS / elapsed * 100, 1)
+        
+        suspicious_processes = []
+        low = cpu < 1.0
+        for pid, status, num_threads, cpu_percent in zip(
+                second['pid'][low].tolist(), second['status'][low].tolist(),
+                second['num_threads'][low].tolist(), cpu[low].tolist()):
+            # psutil resolves full names that /proc/<pid>/stat truncates to 15 characters
+            try:
+                name = self._get_proc(pid).name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            suspicious_processes.append({
+                'pid': pid,
+                'name': name,
+                'status': status,
+                'threads': num_threads,
+                'cpu': cpu_percent
+            })
+        return suspicious_processes
+    
+    def detect_deadlock(self):
+        """
+        Detect potential deadlocks in real-time processes
+        This is a simplified detection based on:
+        - Processes in 'waiting' or 'sleeping' state for too long
+        - Thread analysis for waiting threads
+        Shared open files are not checked: only already-suspicious processes could
+        be flagged that way, so an open_files() pass can never change the result.
+        """
+        # Suspicious: waiting state + low CPU + multiple threads
+        if self._stat_reader is not None:
+            suspicious_processes = self._find_suspicious_procfs()
+        else:
+            suspicious_processes = self._find_suspicious_psutil()
         
         # Remove duplicates
-        potential_deadlock = list(set(potential_deadlock))
+        potential_deadlock = list({p['pid'] for p in suspicious_processes})
         
         # If we found suspicious processes, report them
         if potential_deadlock:
             details = "\n".join([
                 f"  - {p['name']} (PID: {p['pid']}) - Status: {p['status']}, Threads: {p['threads']}, CPU: {p['cpu']:.1f}%"
-                for p in suspicious_processes if p['pid'] in potential_deadlock
+                for p in suspicious_processes
             ])
             
             return {
@@ -203,19 +571,27 @@ class ProcessMonitor:
         }
     
     def get_process_dependencies(self):
-        """Get process dependency graph (parent-child relationships)"""
+        """
+        Get process dependency graph (parent-child relationships)
+        Returns: list of {'child', 'parent', 'name'} dicts (JSON-safe)
+        """
+        # The tree only changes when processes start or exit, so reuse the
+        # previous edges while the set of pids is the same
+        fingerprint = hash(frozenset(psutil.pids()))
+        cached_fingerprint, cached_edges = self._deps_cache
+        if fingerprint == cached_fingerprint:
+            return [edge._asdict() for edge in cached_edges]
+        
         dependencies = []
         
-        for proc in psutil.process_iter(['pid', 'name', 'ppid']):
+        for proc in self._iter_procs(['pid', 'name', 'ppid']):
             try:
                 pinfo = proc.info
                 if pinfo['ppid'] != 0:  # Has parent
-                    dependencies.append({
-                        'child': pinfo['pid'],
-                        'parent': pinfo['ppid'],
-                        'name': pinfo['name']
-                    })
+                    dependencies.append(DependencyEdge(pinfo['pid'], pinfo['ppid'], pinfo['name']))
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
         
-        return dependencies
\ No newline at end of file
+        # Edges are cached as immutable namedtuples; callers get fresh dicts they may modify
+        self._deps_cache = (fingerprint, dependencies)
+        return [edge._asdict() for edge in dependencies]
\ No newline at end of file
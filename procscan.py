@@ -0,0 +1,134 @@
+import os
+import sys
+
+import numpy as np
+
+# Direct /proc reader for the real-time deadlock scan (Linux only).
+# psutil builds a Process object and parses several files for every pid; the scan
+# only needs a few fields of /proc/<pid>/stat, so read those straight into arrays.
+AVAILABLE = sys.platform.startswith('linux') and os.path.isdir('/proc')
+
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if AVAILABLE else 100
+
+# Single-letter states in /proc/<pid>/stat, named the way psutil names them
+STATUS_NAMES = {
+    'R': 'running', 'S': 'sleeping', 'D': 'disk-sleep', 'T': 'stopped',
+    't': 'tracing-stop', 'Z': 'zombie', 'X': 'dead', 'x': 'dead',
+    'K': 'wake-kill', 'W': 'waking', 'I': 'idle', 'P': 'parked'
+}
+
+
+def list_pids():
+    """All pids currently in /proc, sorted"""
+    return sorted(int(entry) for entry in os.listdir('/proc') if entry.isdigit())
+
+
+def parse_stat(data):
+    """
+    Parse the contents of /proc/<pid>/stat
+    Returns: (status, num_threads, cpu_ticks, start_ticks) where cpu_ticks is
+    utime + stime and start_ticks is the start time in clock ticks after boot
+    """
+    # The command name is in parentheses and may itself contain spaces or ')'
+    fields = data[data.rfind(b')') + 2:].split()
+    # fields[0] is field 3 (state); utime, stime, num_threads and starttime are
+    # fields 14, 15, 20 and 22
+    status = STATUS_NAMES.get(fields[0].decode(), '?')
+    return status, int(fields[17]), int(fields[11]) + int(fields[12]), int(fields[19])
+
+
+def read_stat(pid):
+    """parse_stat for one pid; raises OSError if the process is gone"""
+    with open(f'/proc/{pid}/stat', 'rb') as f:
+        return parse_stat(f.read())
+
+
+def scan(pids=None, read=read_stat):
+    """
+    Read state, thread count, CPU ticks and start time of every process (or only of pids)
+    Processes that exit mid-scan or cannot be read are left out
+    Returns: {'pid', 'status', 'num_threads', 'cpu_ticks', 'start_ticks'} NumPy arrays
+    in pid order
+    """
+    if pids is None:
+        pids = list_pids()
+
+    found, statuses, threads, ticks, starts = [], [], [], [], []
+    for pid in pids:
+        try:
+            status, num_threads, cpu_ticks, start_ticks = read(pid)
+        except (OSError, ValueError, IndexError):
+            continue
+        found.append(pid)
+        statuses.append(status)
+        threads.append(num_threads)
+        ticks.append(cpu_ticks)
+        starts.append(start_ticks)
+
+    return {
+        'pid': np.array(found, dtype=np.int32),
+        'status': np.array(statuses, dtype=object),
+        'num_threads': np.array(threads, dtype=np.int32),
+        'cpu_ticks': np.array(ticks, dtype=np.int64),
+        'start_ticks': np.array(starts, dtype=np.int64)
+    }
+
+
+class StatReader:
+    """
+    Reads /proc/<pid>/stat through descriptors kept open between scans
+    procfs regenerates the file on every pread() at offset 0, so a repeat scan
+    costs one syscall per pid instead of open + read + close
+    """
+
+    STAT_READ_SIZE = 1024
+
+    # Stay well under the common 1024 open-file soft limit; pids past the cap
+    # are read with a plain open/close
+    MAX_OPEN_FDS = 512
+
+    def __init__(self):
+        self._stat_fds = {}  # pid -> raw fd of /proc/<pid>/stat
+
+    def read_stat(self, pid):
+        """read_stat() through the cached descriptor for pid, opening one if needed"""
+        fd = self._stat_fds.get(pid)
+        if fd is not None:
+            try:
+                return parse_stat(os.pread(fd, self.STAT_READ_SIZE, 0))
+            except (OSError, ValueError, IndexError):
+                # The process exited (ESRCH); its pid may already belong to a new one
+                self._close(pid)
+
+        if len(self._stat_fds) >= self.MAX_OPEN_FDS:
+            return read_stat(pid)
+
+        fd = os.open(f'/proc/{pid}/stat', os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            result = parse_stat(os.pread(fd, self.STAT_READ_SIZE, 0))
+        except BaseException:
+            os.close(fd)
+            raise
+        self._stat_fds[pid] = fd
+        return result
+
+    def scan(self, pids=None):
+        """scan() through the cached descriptors; a full scan also closes those of exited pids"""
+        if pids is None:
+            pids = list_pids()
+            live = set(pids)
+            for pid in [pid for pid in self._stat_fds if pid not in live]:
+                self._close(pid)
+        return scan(pids, self.read_stat)
+
+    def close(self):
+        """Close every cached descriptor"""
+        for pid in list(self._stat_fds):
+            self._close(pid)
+
+    def _close(self, pid):
+        fd = self._stat_fds.pop(pid)
+        try:
+            os.close(fd)
+        except OSError:
+            pass
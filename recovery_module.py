@@ -1,6 +1,47 @@
 import psutil
 import signal
 import os
+from contextlib import nullcontext
+
+import numpy as np
+
+# Below this many processes the plain Python scoring loop is cheaper than NumPy setup
+VECTORIZE_MIN_PROCESSES = 8
+
+# Fixed text for recovery options, shared by every option instead of rebuilt per call.
+# Tuples so the shared values cannot be mutated; they serialize to JSON like lists.
+_RISK_TABLE = {
+    'critical': ('critical', '⚠️ CRITICAL: Terminating this process may cause system crash or instability!'),
+    'system': ('high', '⚠️ WARNING: This is a system process. Termination may affect system functionality.'),
+    'user': ('low', '✓ Safe: User process, minimal system impact.')
+}
+
+_RECOMMEND_TABLE = {
+    'critical': '🚫 NOT RECOMMENDED: Do not terminate critical system processes!',
+    'system': '⚠️ Use with caution: Try other options first'
+}
+_RECOMMEND_LOW_IMPACT = '✓ RECOMMENDED: Minimal impact, safe to terminate'
+_RECOMMEND_DEFAULT = '✓ Safe: Can be terminated if necessary'
+
+_PROS_TABLE = {
+    ('terminate', 'user'): ('Immediately breaks deadlock', 'Frees up resources', 'Simple and effective'),
+    ('terminate', 'system'): ('Breaks deadlock', 'Frees system resources'),
+    ('terminate', 'critical'): ('Breaks deadlock', 'Frees system resources'),
+    ('terminate', 'unknown'): ('Breaks deadlock', 'Frees system resources'),
+    ('suspend', 'user'): ('Reversible', 'No data loss', 'Can resume later'),
+    ('suspend', 'system'): ('Reversible', 'No data loss', 'Can resume later'),
+    ('suspend', 'unknown'): ('Reversible', 'No data loss', 'Can resume later')
+}
+
+_CONS_TABLE = {
+    ('terminate', 'user'): ('Unsaved work may be lost',),
+    ('terminate', 'system'): ('Unsaved work may be lost', 'May affect system stability', 'Dependent processes may fail'),
+    ('terminate', 'critical'): ('Unsaved work may be lost', '⚠️ SYSTEM CRASH RISK', '⚠️ May corrupt system files'),
+    ('terminate', 'unknown'): ('Unsaved work may be lost',),
+    ('suspend', 'user'): ('Process remains in memory', 'May not fully resolve deadlock'),
+    ('suspend', 'system'): ('Process remains in memory', 'May not fully resolve deadlock'),
+    ('suspend', 'unknown'): ('Process remains in memory', 'May not fully resolve deadlock')
+}
 
 class RecoveryModule:
     """
@@ -21,21 +62,29 @@ class RecoveryModule:
         """
         options = []
         
-        # Filter only process nodes from the cycle (exclude resource nodes)
-        process_ids_in_cycle = [node for node in deadlock_cycle if isinstance(node, str) and node.startswith('P')]
+        # Filter only process nodes from the cycle (exclude resource nodes).
+        # The cycle repeats its first node at the end, so keep each id once.
+        process_ids_in_cycle = dict.fromkeys(
+            node for node in deadlock_cycle if isinstance(node, str) and node.startswith('P'))
+
+        # Look up the few cycle processes instead of scanning every process
+        proc_by_pid = {str(process.get('pid') or process.get('id')): process for process in processes}
+        in_cycle = [proc_by_pid[pid] for pid in process_ids_in_cycle if pid in proc_by_pid]
+        
+        # Score every process at once for larger cycles
+        vectorized = len(in_cycle) >= VECTORIZE_MIN_PROCESSES
+        if vectorized:
+            impact_scores = self._calculate_impacts(in_cycle).tolist()
+        else:
+            impact_scores = [self._calculate_impact(process) for process in in_cycle]
         
-        for process in processes:
-            # Skip if this process is not in the deadlock cycle
+        for process, impact_score in zip(in_cycle, impact_scores):
             pid = process.get('pid') or process.get('id')
-            if str(pid) not in process_ids_in_cycle:
-                continue
-            
             name = process.get('name', 'Unknown')
             process_type = process.get('type', 'user')
             
-            # Calculate risk and impact
+            # Calculate risk
             risk_level, risk_description = self._assess_risk(process_type)
-            impact_score = self._calculate_impact(process)
             
             # Option 1: Terminate Process
             options.append({
@@ -64,12 +113,16 @@ class RecoveryModule:
                     'impact_score': impact_score * 0.5,
                     'recommendation': 'Safe alternative to termination',
                     'description': f'Suspend {name} (ID: {pid})',
-                    'pros': ['Reversible', 'No data loss', 'Can resume later'],
-                    'cons': ['Process remains in memory', 'May not fully resolve deadlock']
+                    'pros': self._get_pros('suspend', process_type),
+                    'cons': self._get_cons('suspend', process_type)
                 })
         
         # Sort by impact score (lower is better)
-        options.sort(key=lambda x: x['impact_score'])
+        if vectorized:
+            order = np.argsort([option['impact_score'] for option in options], kind='stable')
+            options = [options[i] for i in order]
+        else:
+            options.sort(key=lambda x: x['impact_score'])
         
         # Mark recommended option
         if options:
@@ -79,12 +132,7 @@ class RecoveryModule:
     
     def _assess_risk(self, process_type):
         """Assess risk level of terminating a process"""
-        if process_type == 'critical':
-            return 'critical', '⚠️ CRITICAL: Terminating this process may cause system crash or instability!'
-        elif process_type == 'system':
-            return 'high', '⚠️ WARNING: This is a system process. Termination may affect system functionality.'
-        else:
-            return 'low', '✓ Safe: User process, minimal system impact.'
+        return _RISK_TABLE.get(process_type, _RISK_TABLE['user'])
     
     def _calculate_impact(self, process):
         """Calculate impact score (0-100, lower is better)"""
@@ -114,47 +162,34 @@ class RecoveryModule:
         
         return round(impact, 2)
     
+    def _calculate_impacts(self, processes):
+        """Vectorized _calculate_impact for many processes; returns a NumPy array"""
+        types = np.array([process.get('type', 'user') for process in processes], dtype=object)
+        memory_percent = np.array([process.get('memory_percent', 0) for process in processes], dtype=float)
+        cpu_percent = np.array([process.get('cpu_percent', 0) for process in processes], dtype=float)
+        num_threads = np.array([process.get('num_threads', 0) for process in processes], dtype=float)
+        
+        # Type impact, then memory, CPU and thread count impact (same weights as _calculate_impact)
+        type_weight = np.where(types == 'critical', 100, np.where(types == 'system', 50, 10))
+        impacts = type_weight + memory_percent * 0.5 + cpu_percent * 0.3 + num_threads * 0.5
+        return np.round(impacts, 2)
+    
     def _get_recommendation(self, process_type, impact_score):
         """Get recommendation text"""
-        if process_type == 'critical':
-            return '🚫 NOT RECOMMENDED: Do not terminate critical system processes!'
-        elif process_type == 'system':
-            return '⚠️ Use with caution: Try other options first'
-        elif impact_score < 20:
-            return '✓ RECOMMENDED: Minimal impact, safe to terminate'
-        else:
-            return '✓ Safe: Can be terminated if necessary'
+        recommendation = _RECOMMEND_TABLE.get(process_type)
+        if recommendation is not None:
+            return recommendation
+        return _RECOMMEND_LOW_IMPACT if impact_score < 20 else _RECOMMEND_DEFAULT
     
     def _get_pros(self, action, process_type):
         """Get pros for an action"""
-        if action == 'terminate':
-            if process_type == 'user':
-                return [
-                    'Immediately breaks deadlock',
-                    'Frees up resources',
-                    'Simple and effective'
-                ]
-            else:
-                return [
-                    'Breaks deadlock',
-                    'Frees system resources'
-                ]
-        return []
+        return _PROS_TABLE.get((action, process_type), _PROS_TABLE.get((action, 'unknown'), ()))
     
     def _get_cons(self, action, process_type):
         """Get cons for an action"""
-        if action == 'terminate':
-            cons = ['Unsaved work may be lost']
-            if process_type == 'system':
-                cons.append('May affect system stability')
-                cons.append('Dependent processes may fail')
-            elif process_type == 'critical':
-                cons.append('⚠️ SYSTEM CRASH RISK')
-                cons.append('⚠️ May corrupt system files')
-            return cons
-        return []
+        return _CONS_TABLE.get((action, process_type), _CONS_TABLE.get((action, 'unknown'), ()))
     
-    def execute_action(self, action, process_id, deadlock_detector=None):
+    def execute_action(self, action, process_id, deadlock_detector=None, detector_lock=None):
         """
         Execute recovery action
         
@@ -162,16 +197,79 @@ class RecoveryModule:
             action: 'terminate' or 'suspend'
             process_id: Process ID to act upon (can be string like 'P1' or integer PID)
             deadlock_detector: Reference to deadlock detector for manual mode
+            detector_lock: Lock guarding deadlock_detector; held only while a manual
+                mode process is removed, never during real-time waits
         
         Returns:
             Result dictionary with success status
         """
+        return self.execute_actions_bulk([(action, process_id)], deadlock_detector, detector_lock)[0]
+    
+    def execute_actions_bulk(self, actions, deadlock_detector=None, detector_lock=None):
+        """
+        Execute several recovery actions, waiting for terminations together
+        
+        Args:
+            actions: List of (action, process_id) tuples
+            deadlock_detector: Reference to deadlock detector for manual mode
+            detector_lock: Lock guarding deadlock_detector (see execute_action)
+        
+        Returns:
+            List of result dictionaries, in the same order as actions
+        """
+        results = [None] * len(actions)
+        terminating = []
+        
+        # First pass: send terminate to every real process without waiting
+        for index, (action, process_id) in enumerate(actions):
+            if action != 'terminate' or self._is_manual_process(process_id):
+                results[index] = self._execute_single(action, process_id, deadlock_detector, detector_lock)
+                continue
+            try:
+                process = psutil.Process(int(process_id))
+                process_name = process.name()
+                process.terminate()
+            except Exception as e:
+                results[index] = self._error_result(action, process_id, e)
+                continue
+            terminating.append((index, process, process_name, process_id))
+        
+        if not terminating:
+            return results
+        
+        # Wait for all of them at once, then force kill the leftovers
+        _, alive = psutil.wait_procs([entry[1] for entry in terminating], timeout=5)
+        alive = set(alive)
+        for index, process, process_name, process_id in terminating:
+            if process in alive:
+                try:
+                    process.kill()
+                except psutil.NoSuchProcess:
+                    pass
+                except Exception as e:
+                    results[index] = self._error_result('terminate', process_id, e)
+                    continue
+            results[index] = {
+                'success': True,
+                'message': f'Process {process_name} (PID: {process_id}) terminated successfully',
+                'action': 'terminate'
+            }
+        
+        return results
+    
+    def _is_manual_process(self, process_id):
+        """Manual mode processes use string IDs like 'P1' or small integers"""
+        return isinstance(process_id, str) or (isinstance(process_id, int) and process_id < 100)
+    
+    def _execute_single(self, action, process_id, deadlock_detector=None, detector_lock=None):
+        """Execute a manual mode action or a non-terminate real-time action"""
         # Check if it's a manual mode process (string ID like 'P1')
-        if isinstance(process_id, str) or (isinstance(process_id, int) and process_id < 100):
+        if self._is_manual_process(process_id):
             # Manual mode - simulate the action and update the system
             if deadlock_detector:
                 # Actually remove the process from the system
-                success = deadlock_detector.remove_process(str(process_id))
+                with detector_lock or nullcontext():
+                    success = deadlock_detector.remove_process(str(process_id))
                 if success:
                     return {
                         'success': True,
@@ -199,24 +297,7 @@ class RecoveryModule:
             process = psutil.Process(int(process_id))
             process_name = process.name()
             
-            if action == 'terminate':
-                # Terminate process
-                process.terminate()
-                
-                # Wait for process to terminate
-                try:
-                    process.wait(timeout=5)
-                except psutil.TimeoutExpired:
-                    # Force kill if not terminated
-                    process.kill()
-                
-                return {
-                    'success': True,
-                    'message': f'Process {process_name} (PID: {process_id}) terminated successfully',
-                    'action': 'terminate'
-                }
-            
-            elif action == 'suspend':
+            if action == 'suspend':
                 # Suspend process (POSIX only, limited Windows support)
                 if os.name == 'posix':
                     process.suspend()
@@ -254,21 +335,25 @@ class RecoveryModule:
                 'action': action
             }
         
-        except psutil.NoSuchProcess:
+        except Exception as e:
+            return self._error_result(action, process_id, e)
+    
+    def _error_result(self, action, process_id, error):
+        """Build the failure result for an exception raised by psutil"""
+        if isinstance(error, psutil.NoSuchProcess):
             return {
                 'success': False,
                 'message': f'Process {process_id} not found',
                 'action': action
             }
-        except psutil.AccessDenied:
+        if isinstance(error, psutil.AccessDenied):
             return {
                 'success': False,
                 'message': f'Access denied. Cannot {action} process {process_id}. Try running as administrator.',
                 'action': action
             }
-        except Exception as e:
-            return {
-                'success': False,
-                'message': f'Error: {str(e)}',
-                'action': action
-            }
+        return {
+            'success': False,
+            'message': f'Error: {str(error)}',
+            'action': action
+        }